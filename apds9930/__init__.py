@@ -22,8 +22,56 @@ them on.
 
 __all__ = ("APDS9930", "regs")
 
-import smbus
+try:
+    # smbus2 is a drop-in replacement for smbus that additionally
+    # provides i2c_msg, which lets several transfers be combined into
+    # a single ioctl. Fall back to plain smbus when it's not there.
+    import smbus2 as smbus
+    from smbus2 import i2c_msg
+except ImportError:
+    import smbus
+    i2c_msg = None
+import threading
 from .values import *
+from .values import _LPC_NUM
+from . import values as regs
+
+# Protects the shared SMBus cache in APDS9930_I2C_Base
+_bus_lock = threading.Lock()
+
+# Actual ALS gain multiplier for each AGAIN register value
+_AGAIN_MULT = (1.0, 8.0, 16.0, 120.0)
+
+# Set/clear masks for each of the seven ENABLE register bits
+_SET_MASK = tuple(1 << i for i in range(7))
+_CLR_MASK = tuple(~(1 << i) & 0xFF for i in range(7))
+
+def _word_property(reg_l, doc=None):
+    """
+    Build a property for a 16-bit little-endian value stored in the
+    register pair starting at reg_l. Both accessors cost a single
+    SMBus word transaction.
+    """
+    def getter(self):
+        return self.read_word_data(reg_l)
+
+    def setter(self, value):
+        self.write_word_data(reg_l, value & 0xFFFF)
+
+    return property(getter, setter, doc=doc)
+
+# Bit masks for the CONTROL register fields
+_LED_DRIVE_MASK = 0xC0
+_PDIODE_MASK    = 0x30
+_PGAIN_MASK     = 0x0C
+_AGAIN_MASK     = 0x03
+
+# Names for the CONTROL register bit fields, indexed by field value
+_LED_DRIVE_NAMES = ("LED_DRIVE_100MA", "LED_DRIVE_50MA",
+                    "LED_DRIVE_25MA", "LED_DRIVE_12_5MA")
+_PGAIN_NAMES = ("PGAIN_1X", "PGAIN_2X", "PGAIN_4X", "PGAIN_8X")
+_PDIODE_NAMES = (None, None, "Ch1 diode", None)
+_AGAIN_NAMES = ("AGAIN_1X", "AGAIN_8X", "AGAIN_16X", "AGAIN_120X")
 
 class APDS9930_I2C_Base(object):
     """
@@ -33,12 +81,37 @@ class APDS9930_I2C_Base(object):
     bus must be an integer curresponding to
     the I2C bus you want to use. address is the I2C address of the
     device.
+
+    Open buses are shared between instances: creating two objects on
+    the same bus number opens /dev/i2c-N only once.
     """
+
+    __slots__ = ("_bus_number", "_bus", "address")
+
+    # Open SMBus objects shared between instances, keyed by bus
+    # number, each with the number of instances using it.
+    _bus_cache = {}
+
     def __init__(self, bus, address):
-        self._bus = smbus.SMBus()
-        self._bus.open(bus)
+        self._bus_number = bus
+        self._bus = self._get_bus(bus)
         self.address = address
 
+    @classmethod
+    def _get_bus(cls, bus):
+        """
+        Return an open SMBus object for the given bus number, reusing
+        an already open one if another instance is using it.
+        """
+        with _bus_lock:
+            try:
+                bus_obj, refcount = cls._bus_cache[bus]
+            except KeyError:
+                bus_obj = smbus.SMBus(bus)
+                refcount = 0
+            cls._bus_cache[bus] = (bus_obj, refcount + 1)
+            return bus_obj
+
     def write_byte(self, data):
         """
         Write a byte to the specified address. Useful to interact with
@@ -68,23 +141,66 @@ class APDS9930_I2C_Base(object):
         """
         return self._bus.read_byte(self.address)
 
+    def _read_msgs(self, reg, count):
+        """
+        Read count bytes starting from reg with a single combined
+        write-then-read transaction (one ioctl, repeated START).
+        Only available with smbus2.
+        """
+        read = i2c_msg.read(self.address, count)
+        self._bus.i2c_rdwr(i2c_msg.write(self.address, [reg]), read)
+        return list(read)
+
     def read_byte_data(self, reg, mode=AUTO_INCREMENT):
         """
         Read a byte from the specified address.
         """
+        if i2c_msg is not None:
+            return self._read_msgs(reg | mode, 1)[0]
         return self._bus.read_byte_data(self.address, reg | mode)
 
     def read_block_data(self, reg, len, mode=AUTO_INCREMENT):
         """
         Read a block with size len starting from the specified address.
         """
+        if i2c_msg is not None:
+            return self._read_msgs(reg | mode, len)
         return self._bus.read_i2c_block_data(self.address, reg | mode, len)
 
+    def read_word_data(self, reg, mode=AUTO_INCREMENT):
+        """
+        Read two consecutive registers (little-endian) in a single
+        I2C transaction, starting from the specified address. mode
+        should be left to :py:const:`~apds9930.values.AUTO_INCREMENT` so that the device selects
+        the following register after the first byte has been read.
+        """
+        if i2c_msg is not None:
+            data = self._read_msgs(reg | mode, 2)
+            return data[0] | (data[1] << 8)
+        return self._bus.read_word_data(self.address, reg | mode)
+
+    def write_word_data(self, reg, data, mode=AUTO_INCREMENT):
+        """
+        Write a 16-bit value to two consecutive registers
+        (little-endian, low byte first) in a single I2C transaction.
+        Like for :py:meth:`read_word_data`, mode should be left to
+        :py:const:`~apds9930.values.AUTO_INCREMENT`.
+        """
+        self._bus.write_word_data(self.address, reg | mode, data)
+
     def close(self):
         """
-        Close the I2C bus.
+        Close the I2C bus. The underlying bus object is shared with
+        other instances on the same bus number, so it is only actually
+        closed when the last of them is closed.
         """
-        self._bus.close()
+        with _bus_lock:
+            bus_obj, refcount = self._bus_cache[self._bus_number]
+            if refcount <= 1:
+                del self._bus_cache[self._bus_number]
+                bus_obj.close()
+            else:
+                self._bus_cache[self._bus_number] = (bus_obj, refcount - 1)
 
 class APDS9930(APDS9930_I2C_Base):
     """
@@ -97,55 +213,126 @@ class APDS9930(APDS9930_I2C_Base):
     from the default (0x39).
     """
 
+    __slots__ = ("_id", "_enable_shadow", "_control_shadow",
+                 "_again_mult", "_lpc")
+
     def __init__(self, bus, address=APDS9930_I2C_ADDR):
         super(APDS9930, self).__init__(bus, address)
 
-        self.address = HexInt(self.address) # For aesthetic purposes only
-
-        # Check device ID against preset values
-        if self.id not in APDS9930_IDs:
-            raise SensorError("Device ID not recognized: {0}".format(hex(self.id)))
-        
-        # Turn off all features (set ENABLE to 0x00)
-        self.set_mode(ALL, OFF)
-
-        # Set default values for ambient light and proximity registers
-        self.write_byte_data(APDS9930_ATIME, DEFAULT_ATIME)
-        self.write_byte_data(APDS9930_WTIME, DEFAULT_WTIME)
-        self.write_byte_data(APDS9930_PPULSE, DEFAULT_PPULSE)
-        self.write_byte_data(APDS9930_POFFSET, DEFAULT_POFFSET)
-        self.write_byte_data(APDS9930_CONFIG, DEFAULT_CONFIG)
-
-        self.led_drive = DEFAULT_PDRIVE
-        self.proximity_gain = DEFAULT_PGAIN
-        self.ambient_light_gain = DEFAULT_AGAIN
-        self.proximity_diode = DEFAULT_PDIODE
-        self.proximity_int_low_threshold = DEFAULT_PILT
-        self.proximity_int_high_threshold = DEFAULT_PIHT
-        self.light_int_low_threshold = DEFAULT_AILT
-        self.light_int_high_threshold = DEFAULT_AIHT
-
-        self.write_byte_data(APDS9930_PERS, DEFAULT_PERS)
+        # Everything past this point talks to the device and can
+        # raise; release our reference to the shared bus on the way
+        # out so a failed constructor doesn't leak its refcount and
+        # keep /dev/i2c-N open forever.
+        try:
+            self.address = HexInt(self.address) # For aesthetic purposes only
+
+            # Check the device ID against preset values and turn off all
+            # features (set ENABLE to 0x00). With smbus2 available, the ID
+            # read and the ENABLE write go out as one combined transaction.
+            if i2c_msg is not None:
+                id_write = i2c_msg.write(self.address, [APDS9930_ID | AUTO_INCREMENT])
+                id_read = i2c_msg.read(self.address, 1)
+                enable_write = i2c_msg.write(self.address,
+                                             [APDS9930_ENABLE | AUTO_INCREMENT, 0x00])
+                self._bus.i2c_rdwr(id_write, id_read, enable_write)
+                device_id = list(id_read)[0]
+            else:
+                device_id = self.read_byte_data(CMD_ID)
+
+            if device_id not in APDS9930_IDs:
+                raise SensorError("Device ID not recognized: {0}".format(hex(device_id)))
+
+            # The ID register is immutable, so remember it and never read
+            # it again.
+            self._id = device_id
+
+            if i2c_msg is None:
+                # The combined transaction above already cleared ENABLE
+                self.write_byte_data(CMD_ENABLE, 0x00)
+
+            # Shadow copy of the ENABLE register, so that mode changes
+            # don't need to read it back from the device every time. All
+            # features have just been turned off.
+            self._enable_shadow = DEFAULT_ENABLE
+
+            # Set default values for ambient light and proximity
+            # registers. WTIME through CONTROL (0x03-0x0F) are contiguous,
+            # so the wait time, both interrupt threshold pairs, PERS,
+            # CONFIG, PPULSE and CONTROL all go out in one block write;
+            # only ATIME and POFFSET need their own transactions.
+            # DEFAULT_CONTROL already folds the four CONTROL bit fields
+            # into one byte, so none of them go through the property
+            # setters, each of which would rewrite the register.
+            self.write_byte_data(CMD_ATIME, DEFAULT_ATIME)
+            self.write_block_data(CMD_WTIME,
+                                  [DEFAULT_WTIME,
+                                   DEFAULT_AILT & 0xFF, (DEFAULT_AILT >> 8) & 0xFF,
+                                   DEFAULT_AIHT & 0xFF, (DEFAULT_AIHT >> 8) & 0xFF,
+                                   DEFAULT_PILT & 0xFF, (DEFAULT_PILT >> 8) & 0xFF,
+                                   DEFAULT_PIHT & 0xFF, (DEFAULT_PIHT >> 8) & 0xFF,
+                                   DEFAULT_PERS, DEFAULT_CONFIG, DEFAULT_PPULSE,
+                                   DEFAULT_CONTROL])
+            self.write_byte_data(CMD_POFFSET, DEFAULT_POFFSET)
+
+            # Shadow copy of the CONTROL register, like the one kept for
+            # ENABLE. The bit field properties work on this value instead
+            # of reading the register back from the device.
+            self._control_shadow = DEFAULT_CONTROL
+            self._again_mult = _AGAIN_MULT[DEFAULT_AGAIN]
+            self._lpc = _LPC_NUM / self._again_mult
+        except Exception:
+            self.close()
+            raise
 
     @property
     def id(self):
         """
-        The ID of the device, stored in the ID register.
+        The ID of the device, stored in the ID register. The register
+        never changes, so it is read once at initialization and served
+        from memory afterwards.
         """
-        return HexInt(self.read_byte_data(APDS9930_ID))
-    
+        return self._id
+
+    def describe_id(self):
+        """
+        Like :py:attr:`.id`, but wrapped in a :py:class:`HexInt` that prints itself
+        as a hex number.
+        """
+        return HexInt(self.id)
+
+
     @property
     def mode(self):
         """
         The value of the ENABLE register, which stores
-        the enabled features of the sensor. You should not set this
-        property directly unless you know what you're doing. Use :py:meth:`.set_mode`
+        the enabled features of the sensor. A shadow copy of the
+        register is kept in memory, so reading this property does not
+        touch the bus and setting it only writes when the value actually
+        changes. You should not set this property directly unless you
+        know what you're doing. Use :py:meth:`.set_mode`
         and/or the specific feature methods instead.
         """
-        return BinInt(self.read_byte_data(APDS9930_ENABLE), byte=True)
+        return self._enable_shadow
     @mode.setter
     def mode(self, value):
-        self.write_byte_data(APDS9930_ENABLE, value)
+        if value != self._enable_shadow:
+            self.write_byte_data(CMD_ENABLE, value)
+            self._enable_shadow = int(value)
+
+    def resync_enable(self):
+        """
+        Re-read the ENABLE register from the device into the shadow
+        copy. Only needed when something outside this class may have
+        changed the register behind our back.
+        """
+        self._enable_shadow = self.read_byte_data(CMD_ENABLE)
+
+    def describe_mode(self):
+        """
+        Like :py:attr:`.mode`, but wrapped in a :py:class:`BinInt` that prints itself
+        as a zero-padded binary number.
+        """
+        return BinInt(self.mode, byte=True)
 
     def get_mode(self, mode):
         """
@@ -167,7 +354,7 @@ class APDS9930(APDS9930_I2C_Base):
         The specified feature is either enabled or disabled depending
         on whether the method returns True or False
         """
-        return bool((self.mode & (1 << mode)) >> mode)
+        return bool(self._enable_shadow & (1 << mode))
 
     def set_mode(self, mode, enable):
         """
@@ -189,15 +376,35 @@ class APDS9930(APDS9930_I2C_Base):
         reg_val = self.mode
 
         if mode >= 0 and mode <= 6:
-            if enable:
-                reg_val |= 1 << mode
-            else:
-                reg_val &= -(1 << mode)
+            reg_val = (reg_val | _SET_MASK[mode]) if enable \
+                 else (reg_val & _CLR_MASK[mode])
         elif mode == ALL:
             reg_val = 0x7F if enable else 0x00
 
         self.mode = reg_val
 
+    def _update_control(self, mask, value):
+        """
+        Replace the bits selected by mask in the CONTROL register
+        shadow with value, writing the register out only if it
+        actually changed.
+        """
+        new = (self._control_shadow & ~mask & 0xFF) | value
+
+        if new != self._control_shadow:
+            self.write_byte_data(CMD_CONTROL, new)
+            self._control_shadow = new
+
+    def resync_control(self):
+        """
+        Re-read the CONTROL register from the device into the shadow
+        copy. Only needed when something outside this class may have
+        changed the register behind our back.
+        """
+        self._control_shadow = self.read_byte_data(CMD_CONTROL)
+        self._again_mult = _AGAIN_MULT[self._control_shadow & 3]
+        self._lpc = _LPC_NUM / self._again_mult
+
     @property
     def power(self):
         """
@@ -278,9 +485,13 @@ class APDS9930(APDS9930_I2C_Base):
         """
 
         self.ambient_light_gain = DEFAULT_AGAIN
-        self.ambient_light_interrupt = interrupt
-        self.power = True
-        self.ambient_light_sensor = True
+
+        # Build the final ENABLE value and write it in one go instead
+        # of toggling one bit at a time.
+        bits = (1 << POWER) | (1 << AMBIENT_LIGHT)
+        if interrupt:
+            bits |= 1 << AMBIENT_LIGHT_INT
+        self.mode = (self.mode & ~(1 << AMBIENT_LIGHT_INT) & 0xFF) | bits
 
     def enable_proximity_sensor(self, interrupt=False):
         """
@@ -290,12 +501,19 @@ class APDS9930(APDS9930_I2C_Base):
         be enabled.
         """
 
-        self.proximity_gain = DEFAULT_PGAIN
-        self.led_drive = DEFAULT_PDRIVE
-        self.proximity_diode = DEFAULT_PDIODE
-        self.enable_proximity_interrupt = interrupt
-        self.power = True
-        self.proximity_sensor = True
+        # Program LED drive, diode and gain with a single CONTROL
+        # update instead of three separate ones.
+        self._update_control(_LED_DRIVE_MASK | _PDIODE_MASK | _PGAIN_MASK,
+                             (DEFAULT_PDRIVE << 6) |
+                             (DEFAULT_PDIODE << 4) |
+                             (DEFAULT_PGAIN << 2))
+
+        # Build the final ENABLE value and write it in one go instead
+        # of toggling one bit at a time.
+        bits = (1 << POWER) | (1 << PROXIMITY)
+        if interrupt:
+            bits |= 1 << PROXIMITY_INT
+        self.mode = (self.mode & ~(1 << PROXIMITY_INT) & 0xFF) | bits
 
 
     @property
@@ -303,27 +521,45 @@ class APDS9930(APDS9930_I2C_Base):
         """
         Light data from channel 0. Read-only.
         """
-        l = self.read_byte_data(APDS9930_Ch0DATAL)
-        h = self.read_byte_data(APDS9930_Ch0DATAH)
-
-        return l + (h << 8)
+        return self.read_word_data(APDS9930_Ch0DATA_W)
 
     @property
     def ch1_light(self):
         """
         Light data from channel 1. Read-only.
         """
-        l = self.read_byte_data(APDS9930_Ch1DATAL)
-        h = self.read_byte_data(APDS9930_Ch1DATAH)
+        return self.read_word_data(APDS9930_Ch1DATA_W)
 
-        return l + (h << 8)
+    def read_both_channels(self):
+        """
+        Read both light channels with a single block transaction and
+        return them as a (ch0, ch1) tuple. Ch0DATAL through Ch1DATAH
+        are consecutive registers, so this also guarantees the two
+        channels come from the same integration cycle - prefer it over
+        reading :py:attr:`.ch0_light` and :py:attr:`.ch1_light` separately.
+        """
+        data = self.read_block_data(APDS9930_Ch0DATAL, 4)
+        return data[0] | (data[1] << 8), data[2] | (data[3] << 8)
+
+    def read_als_and_proximity(self):
+        """
+        Read both light channels and the proximity value with a single
+        block transaction and return them as a (ch0, ch1, proximity)
+        tuple. Ch0DATAL through PDATAH are consecutive registers, so
+        this costs one transfer instead of three and all three values
+        come from the same snapshot of the data registers.
+        """
+        data = self.read_block_data(APDS9930_Ch0DATAL, APDS9930_ALSPROX_BLOCK_LEN)
+        return (data[0] | (data[1] << 8),
+                data[2] | (data[3] << 8),
+                data[4] | (data[5] << 8))
 
     @property
     def ambient_light(self):
         """
         Ambient light value in lux (read-only).
         """
-        ch0, ch1 = self.ch0_light, self.ch1_light
+        ch0, ch1 = self.read_both_channels()
         return self.ambient_to_lux(ch0, ch1)
 
     def ambient_to_lux(self, ch0, ch1):
@@ -332,54 +568,25 @@ class APDS9930(APDS9930_I2C_Base):
         in lux (according to the datasheet).
         """
 
-        ALSIT = 2.73 * (256 - DEFAULT_ATIME)
         iac = max(ch0 - B * ch1, C * ch0 - D * ch1)
-        lpc = GA * DF / (ALSIT * self.ambient_light_gain)
-        return iac * lpc
+        return iac * self._lpc
 
     @property
     def proximity(self):
         """
         Proximity data. Read-only.
         """
-        l = self.read_byte_data(APDS9930_PDATAL)
-        h = self.read_byte_data(APDS9930_PDATAH)
-
-        return l + (h << 8)
+        return self.read_word_data(APDS9930_PDATA_W)
 
-    @property
-    def proximity_int_low_threshold(self):
-        """
+    proximity_int_low_threshold = _word_property(APDS9930_PILT_W,
+        doc="""
         Proximity interrupt low threshold.
-        """
-        l = self.read_byte_data(APDS9930_PILTL)
-        h = self.read_byte_data(APDS9930_PILTH)
+        """)
 
-        return l + (h << 8)
-    @proximity_int_low_threshold.setter
-    def proximity_int_low_threshold(self, value):
-        h = value >> 8
-        l = value & 0x00FF
-
-        self.write_byte_data(APDS9930_PILTL, l)
-        self.write_byte_data(APDS9930_PILTH, h)
-
-    @property
-    def proximity_int_high_threshold(self):
-        """
+    proximity_int_high_threshold = _word_property(APDS9930_PIHT_W,
+        doc="""
         Proximity interrupt high threshold.
-        """
-        l = self.read_byte_data(APDS9930_PIHTL)
-        h = self.read_byte_data(APDS9930_PIHTH)
-
-        return l + (h << 8)
-    @proximity_int_high_threshold.setter
-    def proximity_int_high_threshold(self, value):
-        h = value >> 8
-        l = value & 0x00FF
-
-        self.write_byte_data(APDS9930_PIHTL, l)
-        self.write_byte_data(APDS9930_PIHTH, h)
+        """)
 
     @property
     def led_drive(self):
@@ -396,24 +603,18 @@ class APDS9930(APDS9930_I2C_Base):
         3        12.5 mA        :py:const:`~apds9930.values.LED_DRIVE_12_5MA`
         ======== ============== ============================================
         """
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-        v =  (reg_val >> 6) & 3     # 3 = 00000011
-
-        return DictReprInt(v, mapping={0: "LED_DRIVE_100MA",
-                                       1: "LED_DRIVE_50MA",
-                                       2: "LED_DRIVE_25MA",
-                                       3: "LED_DRIVE_12_5MA"})
+        return (self._control_shadow >> 6) & 3     # 3 = 00000011
 
     @led_drive.setter
     def led_drive(self, value):
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-
-        value &= 3                # 3 = 00000011
-        value = value << 6
-        reg_val &= int("00111111", 2)
-        reg_val |= value
+        self._update_control(_LED_DRIVE_MASK, (value & 3) << 6)
 
-        self.write_byte_data(APDS9930_CONTROL, reg_val)
+    def describe_led_drive(self):
+        """
+        Like :py:attr:`.led_drive`, but wrapped in a :py:class:`DictReprInt` that
+        prints the matching constant name.
+        """
+        return DictReprInt(self.led_drive, mapping=_LED_DRIVE_NAMES)
 
     @property
     def proximity_gain(self):
@@ -429,24 +630,18 @@ class APDS9930(APDS9930_I2C_Base):
         3       8x         :py:const:`~apds9930.values.PGAIN_8X`
         ======= ========== ====================================
         """
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-        v = (reg_val >> 2) & 3     # 3 = 00000011
-
-        return DictReprInt(v, mapping={0: "PGAIN_1X",
-                                       1: "PGAIN_2X",
-                                       2: "PGAIN_4X",
-                                       3: "PGAIN_8X"})
+        return (self._control_shadow >> 2) & 3     # 3 = 00000011
 
     @proximity_gain.setter
     def proximity_gain(self, value):
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-
-        value &= 3                # 3 = 00000011
-        value = value << 2
-        reg_val &= int("11110011", 2)
-        reg_val |= value
+        self._update_control(_PGAIN_MASK, (value & 3) << 2)
 
-        self.write_byte_data(APDS9930_CONTROL, reg_val)
+    def describe_proximity_gain(self):
+        """
+        Like :py:attr:`.proximity_gain`, but wrapped in a :py:class:`DictReprInt` that
+        prints the matching constant name.
+        """
+        return DictReprInt(self.proximity_gain, mapping=_PGAIN_NAMES)
 
     @property
     def proximity_diode(self):
@@ -462,21 +657,18 @@ class APDS9930(APDS9930_I2C_Base):
         3       Reserved
         ======= ===============
         """
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-        v = (reg_val >> 4) & 3     # 3 = 00000011
-
-        return DictReprInt(v, mapping={2: "Ch1 diode"})
+        return (self._control_shadow >> 4) & 3     # 3 = 00000011
 
     @proximity_diode.setter
     def proximity_diode(self, value):
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-
-        value &= 3                # 3 = 00000011
-        value = value << 4
-        reg_val &= int("11001111", 2)
-        reg_val |= value
+        self._update_control(_PDIODE_MASK, (value & 3) << 4)
 
-        self.write_byte_data(APDS9930_CONTROL, reg_val)
+    def describe_proximity_diode(self):
+        """
+        Like :py:attr:`.proximity_diode`, but wrapped in a :py:class:`DictReprInt` that
+        prints the matching diode selection.
+        """
+        return DictReprInt(self.proximity_diode, mapping=_PDIODE_NAMES)
 
     @property
     def ambient_light_gain(self):
@@ -492,57 +684,30 @@ class APDS9930(APDS9930_I2C_Base):
         3       64x       :py:const:`~apds9930.values.AGAIN_120X`
         ======= ========= ======================================
         """
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
-        v = reg_val & 3     # 3 = 00000011
-
-        return DictReprInt(v, mapping={0: "AGAIN_1X",
-                                       1: "AGAIN_8X",
-                                       2: "AGAIN_16X",
-                                       3: "AGAIN_120X"})
+        return self._control_shadow & 3     # 3 = 00000011
 
     @ambient_light_gain.setter
     def ambient_light_gain(self, value):
-        reg_val = self.read_byte_data(APDS9930_CONTROL)
+        self._update_control(_AGAIN_MASK, value & 3)
+        self._again_mult = _AGAIN_MULT[value & 3]
+        self._lpc = _LPC_NUM / self._again_mult
 
-        value &= 3                # 3 = 00000011
-        reg_val &= int("11111100", 2)
-        reg_val |= value
-
-        self.write_byte_data(APDS9930_CONTROL, reg_val)
-
-    @property
-    def ambient_light_int_low_threshold(self):
+    def describe_ambient_light_gain(self):
         """
-        Ambient light interrupt low threshold.
+        Like :py:attr:`.ambient_light_gain`, but wrapped in a :py:class:`DictReprInt`
+        that prints the matching constant name.
         """
-        l = self.read_byte_data(APDS9930_AILTL)
-        h = self.read_byte_data(APDS9930_AILTH)
-
-        return l + (h << 8)
-    @ambient_light_int_low_threshold.setter
-    def ambient_light_int_low_threshold(self, value):
-        h = value >> 8
-        l = value & 0x00FF
+        return DictReprInt(self.ambient_light_gain, mapping=_AGAIN_NAMES)
 
-        self.write_byte_data(APDS9930_AILTL, l)
-        self.write_byte_data(APDS9930_AILTH, h)
+    ambient_light_int_low_threshold = _word_property(APDS9930_AILT_W,
+        doc="""
+        Ambient light interrupt low threshold.
+        """)
 
-    @property
-    def ambient_light_int_high_threshold(self):
-        """
+    ambient_light_int_high_threshold = _word_property(APDS9930_AIHT_W,
+        doc="""
         Ambient light interrupt high threshold.
-        """
-        l = self.read_byte_data(APDS9930_AIHTL)
-        h = self.read_byte_data(APDS9930_AIHTH)
-
-        return l + (h << 8)
-    @ambient_light_int_high_threshold.setter
-    def ambient_light_int_high_threshold(self, value):
-        h = value >> 8
-        l = value & 0x00FF
-
-        self.write_byte_data(APDS9930_AIHTL, l)
-        self.write_byte_data(APDS9930_AIHTH, h)
+        """)
 
     @property
     def ambient_light_interrupt(self):
@@ -550,7 +715,7 @@ class APDS9930(APDS9930_I2C_Base):
         If True, the device is asserting an ambient light interrupt.
         Set it to None to clear it.
         """
-        val = self.read_byte_data(APDS9930_STATUS)
+        val = self.read_byte_data(CMD_STATUS)
         return bool((val >> 4) & 1)
     @ambient_light_interrupt.setter
     def ambient_light_interrupt(self, value):
@@ -563,7 +728,7 @@ class APDS9930(APDS9930_I2C_Base):
         If True, the device is asserting a proximity interrupt.
         Set it to None to clear it.
         """
-        val = self.read_byte_data(APDS9930_STATUS)
+        val = self.read_byte_data(CMD_STATUS)
         return bool((val >> 5) & 1)
     @proximity_interrupt.setter
     def proximity_interrupt(self, value):
@@ -581,20 +746,29 @@ class APDS9930(APDS9930_I2C_Base):
         Debug: read all the registers from the device and
         **print** them.
         """
-        print "   REGISTER       DECIMAL  HEXADECIMAL     BINARY"
-        for reg in REGISTERS:
-            val = self.read_byte_data(REGISTERS[reg])
-            print "{:<4}  {:>9}    dec {:<3}   hex {:<4}   bin {:08d}".format(hex(REGISTERS[reg]),
-                                                                           reg + ":",
-                                                                           str(int(val)),
-                                                                           hex(val),
-                                                                           int(bin(val)[2:]))
+        # Fetch the whole contiguous register file (0x00-0x19) with a
+        # single block read; only POFFSET (0x1E) needs its own
+        # transaction.
+        vals = list(self.read_block_data(0x00, 0x1A))
+        vals.append(self.read_byte_data(CMD_POFFSET))
+
+        lines = ["   REGISTER       DECIMAL  HEXADECIMAL     BINARY"]
+        for reg, addr in REGISTERS:
+            val = vals[-1] if addr == APDS9930_POFFSET else vals[addr]
+            lines.append("{:<4}  {:>9}    dec {:<3}   hex {:<4}   bin {:08b}".format(hex(addr),
+                                                                                    reg + ":",
+                                                                                    str(int(val)),
+                                                                                    hex(val),
+                                                                                    val))
+        print("\n".join(lines))
 
 
 class HexInt(int):
     """
     Integer that represents itself as a hex number.
     """
+    __slots__ = ()
+
     def __repr__(self):
         return hex(self)
 
@@ -604,13 +778,9 @@ class BinInt(int):
     If byte is True, the integer will be padded with zeroes
     so that it uses at least 8 binary digits.
     """
+    # No __slots__ here: CPython does not allow nonempty slots on
+    # subclasses of variable-length types like int.
     byte = False
-    def __init__(self, n, base=10, byte=False):
-        self.byte = byte
-        if type(n) == int:
-            return super(BinInt, self).__init__(n)
-        else:
-            return super(BinInt, self).__init__(n, base)
 
     def __new__(cls, n, base=10, byte=False):
         if type(n) == int:
@@ -629,18 +799,14 @@ class BinInt(int):
 class DictReprInt(int):
     """
     Integer that represents itself with a name rather than
-    a value. Specify the name mappings in the "mapping" argument.
+    a value. Specify the names in the "mapping" argument as a tuple
+    indexed by value, using None for values without a name.
     """
-    mapping = {}
-
-    def __init__(self, n, base=10, mapping={}):
-        self.mapping = mapping
-        if type(n) == int:
-            return super(DictReprInt, self).__init__(n)
-        else:
-            return super(DictReprInt, self).__init__(n, base)
+    # No __slots__ here: CPython does not allow nonempty slots on
+    # subclasses of variable-length types like int.
+    mapping = ()
 
-    def __new__(cls, n, base=10, mapping={}):
+    def __new__(cls, n, base=10, mapping=()):
         if type(n) == int:
             obj = int.__new__(cls, n)
         else:
@@ -649,8 +815,8 @@ class DictReprInt(int):
         return obj
 
     def __repr__(self):
-        if int(self) in self.mapping:
-            return super(DictReprInt, self).__repr__() + " = " + self.mapping[self]
+        if 0 <= int(self) < len(self.mapping) and self.mapping[int(self)] is not None:
+            return super(DictReprInt, self).__repr__() + " = " + self.mapping[int(self)]
         else:
             return super(DictReprInt, self).__repr__()
 